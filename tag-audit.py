@@ -26,15 +26,59 @@ Usage examples:
 
 from __future__ import annotations
 
+import csv
+import io
 import os
+import re
 import sys
 import argparse
 import json
+import heapq
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from typing import Dict, List, Tuple, Iterable, Optional
 
 import yaml
 
+try:
+    # libyaml-backed loader: same safe semantics, C-speed tokenizing/parsing.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj) -> str:
+    """Serialize for output, preferring orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# Fast-path front matter scanning: we only ever look at tags/categories/draft,
+# so for the common flat Hugo front matter we can skip the full YAML parser.
+FM_KEY_RE = re.compile(r"^(tags|categories|draft)\s*:(.*)$")
+# Sequence items may sit at the key's own indent (column 0), so leading
+# whitespace is optional here.
+FM_LIST_ITEM_RE = re.compile(r"^\s*-\s*(.*?)\s*$")
+# Anything the simple scanner can't handle safely: anchors/aliases, flow
+# mappings, block scalars, comments, or quoting (quoted strings may hide
+# commas/colons). Seeing one of these punts the whole block to PyYAML.
+FM_BAILOUT_RE = re.compile(r"[&*{}>|#\"']")
+# Front matter is almost always well under one chunk; bigger blocks just
+# trigger additional reads.
+FM_READ_CHUNK = 8192
+# Delimiter lines, compiled once at module scope. Matching these in one shot
+# replaces the per-candidate slice/strip validation; both delimiters tolerate
+# the same stray whitespace and CRLF endings the line-based check accepted.
+FM_START_RE = re.compile(rb"[ \t]*---[ \t]*\r?\n")
+FM_END_RE = re.compile(rb"\n[ \t]*---[ \t]*\r?\n")
+FM_END_EOF_RE = re.compile(rb"\n[ \t]*---[ \t]*\r?\Z")
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -60,6 +104,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Skip files where front matter has draft: true."
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or update the parse cache "
+             "(~/.cache/tag-audit/cache.json); reparse every file."
+    )
 
     # Section toggles
     parser.add_argument(
@@ -133,73 +183,267 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def is_front_matter_yaml(lines: List[str]) -> Tuple[int, int]:
-    """Return (start_idx, end_idx) of YAML front matter if present, else (-1, -1)."""
-    if not lines or lines[0].strip() != "---":
-        return -1, -1
-    for idx in range(1, len(lines)):
-        if lines[idx].strip() == "---":
-            return 0, idx
-    return -1, -1
-
-
 def coerce_list(value) -> List[str]:
+    # Tags repeat constantly across files; interning them makes every later
+    # Counter/dict lookup a pointer comparison instead of a string compare.
     if not value:
         return []
     if isinstance(value, str):
         s = value.strip().lower()
-        return [s] if s else []
+        return [sys.intern(s)] if s else []
     if isinstance(value, list):
-        out = []
+        out: List[str] = []
+        append = out.append
+        intern = sys.intern
         for v in value:
             if isinstance(v, str):
                 s = v.strip().lower()
                 if s:
-                    out.append(s)
+                    append(intern(s))
         return out
     return []
 
 
+def scan_front_matter(frontmatter: str) -> Optional[dict]:
+    """Extract tags/categories/draft from flat front matter without PyYAML.
+
+    Returns None if the block uses syntax the scanner doesn't understand
+    (caller should fall back to yaml.safe_load).
+    """
+    data: dict = {}
+    lines = frontmatter.splitlines()
+    i = 0
+    while i < len(lines):
+        m = FM_KEY_RE.match(lines[i])
+        i += 1
+        if not m:
+            continue
+        key, rest = m.group(1), m.group(2).strip()
+        if FM_BAILOUT_RE.search(rest):
+            return None
+        if key == "draft":
+            if rest in ("true", "True"):
+                data["draft"] = True
+            elif rest in ("false", "False", ""):
+                data["draft"] = False
+            else:
+                return None
+        elif rest.startswith("[") and rest.endswith("]"):
+            body = rest[1:-1].strip()
+            if not body:
+                data[key] = []
+            else:
+                vals = [v.strip() for v in body.split(",")]
+                if not all(vals):
+                    # Empty element ('[a,, b]'): invalid YAML — let PyYAML
+                    # reject it with a warning instead of papering over it.
+                    return None
+                data[key] = vals
+        elif rest:
+            data[key] = rest
+        else:
+            # Block list: consume "- item" lines (at the key's indent or
+            # deeper); items must be plain scalars.
+            items = []
+            while i < len(lines):
+                line = lines[i]
+                lm = FM_LIST_ITEM_RE.match(line)
+                if not lm:
+                    if items and line.strip() and line[0] in " \t":
+                        # Indented continuation after list items (multi-line
+                        # scalar or nested structure): not a flat list.
+                        return None
+                    break
+                item = lm.group(1)
+                if (FM_BAILOUT_RE.search(item) or ": " in item
+                        or item.endswith(":")):
+                    return None  # mapping item ('- a: b'), not a scalar
+                items.append(item)
+                i += 1
+            data[key] = items
+    return data
+
+
 def read_front_matter(path: str) -> Optional[dict]:
+    # Read only the leading YAML block, in binary: delimiters are located with
+    # bytes.find (one C-level memmem per probe) instead of a Python line loop,
+    # and we never pull the article body into memory.
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        with open(path, "rb") as f:
+            raw = f.read(FM_READ_CHUNK)
+            sm = FM_START_RE.match(raw)
+            if not sm:
+                return {}
+            start = sm.end()
+            search_from = start - 1
+            while True:
+                em = FM_END_RE.search(raw, search_from)
+                if em:
+                    fm_bytes = raw[start:em.start() + 1]
+                    break
+                more = f.read(FM_READ_CHUNK)
+                if not more:
+                    # Allow a terminator on the last line with no newline.
+                    em = FM_END_EOF_RE.search(raw, search_from)
+                    if not em:
+                        return {}  # opening --- but no terminator
+                    fm_bytes = raw[start:em.start() + 1]
+                    break
+                # Restart from the last newline so a delimiter split across
+                # the chunk boundary is still found.
+                search_from = max(search_from, raw.rfind(b"\n", search_from))
+                raw += more
+        # Cheap substring probe, done before decoding: if none of our key
+        # names appear in the block there is nothing to extract. The stand-in
+        # result only applies when the block has real content — comment-only
+        # and empty blocks parse to nothing and were never counted.
+        if (b"tags" not in fm_bytes and b"categories" not in fm_bytes
+                and b"draft" not in fm_bytes):
+            for line in fm_bytes.splitlines():
+                stripped = line.strip()
+                if stripped and not stripped.startswith(b"#"):
+                    return {"tags": [], "categories": []}
+            return {}
+        frontmatter = fm_bytes.decode("utf-8")
     except Exception as e:
         print(f"⚠️  Error reading {path}: {e}", file=sys.stderr)
         return None
 
-    s, e = is_front_matter_yaml(lines)
-    if s == -1:
-        return {}
+    data = scan_front_matter(frontmatter)
+    if not data:
+        # None: the scanner hit syntax it doesn't understand. {}: the probe
+        # saw a key name but no key line matched (quoted keys, nesting, or
+        # the name buried in some other value) — either way let PyYAML make
+        # the call.
+        try:
+            data = yaml.load(frontmatter, Loader=SafeLoader) or {}
+        except Exception as e:
+            print(f"⚠️  Error parsing YAML in {path}: {e}", file=sys.stderr)
+            return None
+    # data can still be {} here when PyYAML parsed the block to nothing
+    # (comments-only, all-null); those files are skipped, as they always were.
+    return data
+
+
+def iter_paths(content_dir: str, exts: Tuple[str, ...]) -> Iterable[str]:
+    # scandir gives us file-vs-dir straight from the directory read (no extra
+    # stat per entry, unlike os.walk's bookkeeping) and entry.path for free.
+    # exts is a tuple so str.endswith loops over the suffixes in C.
+    stack = [content_dir]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError as e:
+            print(f"⚠️  Error listing {e.filename}: {e}", file=sys.stderr)
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(exts):
+                    yield entry.path
+
+
+# Persistent parse cache: most audit runs follow a handful of edits, so the
+# vast majority of files are byte-identical to last time. Entries are keyed by
+# path and validated against (mtime_ns, size).
+CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "tag-audit", "cache.json",
+)
 
-    frontmatter = "".join(lines[s + 1:e])
+
+def load_cache() -> Dict[str, dict]:
     try:
-        data = yaml.safe_load(frontmatter) or {}
-    except Exception as e:
-        print(f"⚠️  Error parsing YAML in {path}: {e}", file=sys.stderr)
-        return None
-    return data
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}  # missing or corrupt cache: just reparse everything
 
 
-def iter_paths(content_dir: str, exts: List[str]) -> Iterable[str]:
-    for root, _dirs, files in os.walk(content_dir):
-        for filename in files:
-            if any(filename.endswith(ext) for ext in exts):
-                yield os.path.join(root, filename)
+def save_cache(cache: Dict[str, dict]) -> None:
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with open(CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except Exception as e:
+        print(f"⚠️  Error writing cache {CACHE_PATH}: {e}", file=sys.stderr)
+
+
+def parse_one(path: str) -> Tuple[str, Optional[Tuple[List[str], List[str], bool]], bool]:
+    """Parse one file into (path, parsed, cacheable).
+
+    Top-level (not a closure) so it is picklable for worker processes.
+    parsed is None for read/parse failures and for files with no front
+    matter; both are skipped by collect(). Only failures are marked
+    uncacheable, so their warnings repeat on the next run while
+    front-matter-less files get a negative cache entry.
+    """
+    data = read_front_matter(path)
+    if data is None:
+        return path, None, False
+    if not data:
+        return path, None, True
+    return path, (
+        coerce_list(data.get("tags")),
+        coerce_list(data.get("categories")),
+        bool(data.get("draft", False)),
+    ), True
 
 
 def collect(content_dir: str,
-            exts: List[str],
+            exts: Tuple[str, ...],
             ignore_drafts: bool,
-            file_paths: Optional[List[str]] = None
-            ) -> Tuple[Counter, Counter, Dict[str, Dict[str, List[str]]],
+            file_paths: Optional[List[str]] = None,
+            need_tag_map: bool = True,
+            need_cat_map: bool = True,
+            need_file_usage: bool = True,
+            use_cache: bool = True
+            ) -> Tuple[Counter, Counter, Dict[str, List[str]], Dict[str, List[str]],
                        Dict[str, List[str]], Dict[str, List[str]]]:
     tags_counter = Counter()
     cats_counter = Counter()
-    file_usage: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: {"tags": [], "categories": []})
+    # Two flat dicts instead of one defaultdict-of-dicts: plain assignment,
+    # no per-file factory call, and nothing at all when --per-file is off.
+    file_tags: Dict[str, List[str]] = {}
+    file_cats: Dict[str, List[str]] = {}
     tag_to_files: Dict[str, List[str]] = defaultdict(list)
     cat_to_files: Dict[str, List[str]] = defaultdict(list)
 
+    def reduce_results(results: Iterable[Tuple[str, Optional[Tuple[List[str], List[str], bool]]]]) -> None:
+        tc, cc = tags_counter, cats_counter
+        ttf, ctf = tag_to_files, cat_to_files
+        for path, parsed in results:
+            if parsed is None:
+                continue  # read/parse failed or no front matter
+            tags, cats, is_draft = parsed
+
+            if ignore_drafts and is_draft:
+                continue
+
+            # One pass per file: count and map in the same loop rather than
+            # iterating tags once for Counter.update and again for the map.
+            if need_tag_map:
+                for t in tags:
+                    tc[t] += 1
+                    ttf[t].append(path)
+            else:
+                tc.update(tags)
+            if need_cat_map:
+                for c in cats:
+                    cc[c] += 1
+                    ctf[c].append(path)
+            else:
+                cc.update(cats)
+            if need_file_usage:
+                file_tags[path] = tags
+                file_cats[path] = cats
+
+    cache = load_cache() if use_cache else {}
+    new_cache: Dict[str, dict] = {}
+    miss_stats: Dict[str, Tuple[int, int]] = {}
+    misses: List[str] = []
+
     paths: Iterable[str]
     if file_paths:
         paths = file_paths
@@ -207,50 +451,83 @@ def collect(content_dir: str,
         paths = iter_paths(content_dir, exts)
 
     for path in paths:
-        data = read_front_matter(path)
-        if data is None:
-            continue  # read/parse failed
-        if data == {}:
-            # No front matter; skip quietly
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            print(f"⚠️  Error reading {path}: {e}", file=sys.stderr)
             continue
+        entry = cache.get(path)
+        if entry and entry.get("mtime") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            new_cache[path] = entry
+            # tags: None is the negative entry for a file with no front matter.
+            if entry.get("tags") is not None:
+                reduce_results([(path, (entry["tags"], entry["cats"], entry["draft"]))])
+        else:
+            miss_stats[path] = (st.st_mtime_ns, st.st_size)
+            misses.append(path)
+
+    def record_and_reduce(results: Iterable[Tuple[str, Optional[Tuple[List[str], List[str], bool]], bool]]) -> None:
+        for path, parsed, cacheable in results:
+            if cacheable:
+                mtime, size = miss_stats[path]
+                if parsed is None:
+                    new_cache[path] = {"mtime": mtime, "size": size,
+                                       "tags": None, "cats": None, "draft": False}
+                else:
+                    new_cache[path] = {"mtime": mtime, "size": size,
+                                       "tags": parsed[0], "cats": parsed[1], "draft": parsed[2]}
+            reduce_results([(path, parsed)])
+
+    if misses:
+        if file_paths:
+            # Explicit file list (usually just one); not worth spinning up workers.
+            record_and_reduce(map(parse_one, misses))
+        else:
+            # Parsing is CPU-bound pure Python, so processes (not threads) scale.
+            with ProcessPoolExecutor() as ex:
+                record_and_reduce(ex.map(parse_one, misses, chunksize=64))
 
-        if ignore_drafts and bool(data.get("draft", False)):
-            continue
+    if use_cache:
+        if file_paths:
+            # Single-file scans shouldn't evict entries for the rest of the site.
+            new_cache = {**cache, **new_cache}
+        if new_cache != cache:
+            save_cache(new_cache)
 
-        tags = coerce_list(data.get("tags"))
-        cats = coerce_list(data.get("categories"))
+    return tags_counter, cats_counter, file_tags, file_cats, tag_to_files, cat_to_files
 
-        tags_counter.update(tags)
-        cats_counter.update(cats)
-        file_usage[path] = {"tags": tags, "categories": cats}
-        for t in tags:
-            tag_to_files[t].append(path)
-        for c in cats:
-            cat_to_files[c].append(path)
 
-    return tags_counter, cats_counter, file_usage, tag_to_files, cat_to_files
+def count_key(kv: Tuple[str, int]) -> Tuple[int, str]:
+    """Count-descending, name-ascending; shared by full sort and heap select."""
+    return -kv[1], kv[0]
 
 
 def sort_and_filter(counter: Counter, mode: str, min_count: int, top: int) -> List[Tuple[str, int]]:
-    items = [(k, v) for k, v in counter.items() if v >= min_count]
-    if mode == "alpha":
-        items.sort(key=lambda kv: kv[0])
+    if min_count > 0:
+        items = [kv for kv in counter.items() if kv[1] >= min_count]
     else:
-        items.sort(key=lambda kv: (-kv[1], kv[0]))
-    if top > 0:
-        items = items[:top]
+        items = list(counter.items())
+    if mode == "alpha":
+        items.sort(key=itemgetter(0))
+        return items[:top] if top > 0 else items
+    if 0 < top < len(items):
+        # O(n log top) selection instead of sorting the whole tag universe.
+        return heapq.nsmallest(top, items, key=count_key)
+    items.sort(key=count_key)
     return items
 
 
-def print_per_file(file_usage: Dict[str, Dict[str, List[str]]]) -> None:
-    print("\n🗂️  Tag & Category Usage Per File\n")
-    for fname in sorted(file_usage.keys()):
-        tags = ", ".join(file_usage[fname]["tags"]) if file_usage[fname]["tags"] else "(none)"
-        cats = ", ".join(file_usage[fname]["categories"]) if file_usage[fname]["categories"] else "(none)"
-        print(f"{fname}:")
-        print(f"    tags: {tags}")
-        print(f"    categories: {cats}")
-    print("\n---\n")
+def render_per_file(file_tags: Dict[str, List[str]], file_cats: Dict[str, List[str]]) -> str:
+    out = ["\n🗂️  Tag & Category Usage Per File\n"]
+    for fname, tags in sorted(file_tags.items()):
+        cats = file_cats[fname]
+        out.append(
+            f"{fname}:\n"
+            f"    tags: {', '.join(tags) if tags else '(none)'}\n"
+            f"    categories: {', '.join(cats) if cats else '(none)'}"
+        )
+    out.append("\n---\n")
+    return "\n".join(out) + "\n"
 
 
 def render_table_text(rows: List[Tuple[str, int]], header: str) -> str:
@@ -282,18 +559,19 @@ def render_table_markdown(rows: List[Tuple[str, int]], header: str) -> str:
 
 
 def render_table_csv(rows: List[Tuple[str, int]], header: str) -> str:
-    out = ["count,name"]
-    for name, cnt in rows:
-        safe = name.replace('"', '""')
-        out.append(f"{cnt},\"{safe}\"")
-    return "\n".join(out) + "\n"
+    # The C-implemented csv writer also quotes correctly when names contain
+    # commas or newlines, which the old manual quoting got wrong.
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n", quoting=csv.QUOTE_MINIMAL)
+    writer.writerow(["count", "name"])
+    writer.writerows((cnt, name) for name, cnt in rows)
+    return buf.getvalue()
 
 
 def render_table_json(rows: List[Tuple[str, int]], header: str) -> str:
-    return json.dumps(
+    return dumps_json(
         {"header": header, "total": sum(cnt for _, cnt in rows),
-         "rows": [{"name": name, "count": cnt} for name, cnt in rows]},
-        indent=2
+         "rows": [{"name": name, "count": cnt} for name, cnt in rows]}
     )
 
 
@@ -317,7 +595,7 @@ def render_mapping_text(header: str, ordered_keys: List[str], mapping: Dict[str,
     for key in ordered_keys:
         out.append(f"\n{key}")
         out.append("-" * len(key))
-        for path in sorted(mapping.get(key, [])):
+        for path in mapping.get(key, []):
             out.append(f"  {path}")
     out.append("")
     return "\n".join(out)
@@ -331,7 +609,7 @@ def render_mapping_markdown(header: str, ordered_keys: List[str], mapping: Dict[
         return "\n".join(out)
     for key in ordered_keys:
         out.append(f"#### {key}")
-        for path in sorted(mapping.get(key, [])):
+        for path in mapping.get(key, []):
             out.append(f"- `{path}`")
         out.append("")
     return "\n".join(out)
@@ -339,66 +617,91 @@ def render_mapping_markdown(header: str, ordered_keys: List[str], mapping: Dict[
 
 def render_mapping_csv(ordered_keys: List[str], mapping: Dict[str, List[str]]) -> str:
     # name,file
-    out = ["name,file"]
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n", quoting=csv.QUOTE_MINIMAL)
+    writer.writerow(["name", "file"])
     for key in ordered_keys:
-        files = sorted(mapping.get(key, []))
+        files = mapping.get(key, [])
         if not files:
-            out.append(f"\"{key}\",")
+            writer.writerow([key, ""])
         else:
-            for path in files:
-                out.append(f"\"{key}\",\"{path}\"")
-    return "\n".join(out) + "\n"
+            writer.writerows((key, path) for path in files)
+    return buf.getvalue()
 
 
 def render_mapping_json(ordered_keys: List[str], mapping: Dict[str, List[str]], header_key: str) -> str:
-    payload = {header_key: {k: sorted(mapping.get(k, [])) for k in ordered_keys}}
-    return json.dumps(payload, indent=2)
+    payload = {header_key: {k: mapping.get(k, []) for k in ordered_keys}}
+    return dumps_json(payload)
 
 
 def main() -> None:
     args = parse_args()
 
     raw_exts = [x.strip() for x in args.ext.split(",") if x.strip()]
-    exts = [e if e.startswith(".") else f".{e}" for e in raw_exts]
+    exts = tuple(e if e.startswith(".") else f".{e}" for e in raw_exts)
 
     file_paths = [args.file] if args.file else None
 
-    tags_counter, cats_counter, file_usage, tag_to_files, cat_to_files = collect(
+    tags_counter, cats_counter, file_tags, file_cats, tag_to_files, cat_to_files = collect(
         content_dir=args.dir,
         exts=exts,
         ignore_drafts=args.ignore_drafts,
         file_paths=file_paths,
+        need_tag_map=args.by_tag,
+        need_cat_map=args.by_cat,
+        need_file_usage=args.per_file,
+        use_cache=not args.no_cache,
     )
 
+    # Sort each mapping's file list once here; the renderers used to re-sort
+    # per key (and per format) on every call.
+    if args.by_tag:
+        for files in tag_to_files.values():
+            files.sort()
+    if args.by_cat:
+        for files in cat_to_files.values():
+            files.sort()
+
+    # Accumulate every section here and write once at the end; one big
+    # write() beats dozens of line-buffered print() calls.
+    chunks: List[str] = []
+
     # Per-file view (text only)
     if args.per_file:
-        print_per_file(file_usage)
+        chunks.append(render_per_file(file_tags, file_cats))
 
-    # Summary tables
-    if args.summary:
+    # Sorted/filtered rows are shared between the summary tables and the
+    # mapping key order, so compute them at most once per counter.
+    tag_rows: List[Tuple[str, int]] = []
+    cat_rows: List[Tuple[str, int]] = []
+    if args.summary or args.by_tag:
         tag_rows = sort_and_filter(tags_counter, args.sort, args.min_count, args.top)
+    if args.summary or args.by_cat:
         cat_rows = sort_and_filter(cats_counter, args.sort, args.min_count, args.top)
-        print(render_by_format(tag_rows, "Tags", args.format), end="")
-        print(render_by_format(cat_rows, "Categories", args.format), end="")
+
+    # Summary tables
+    if args.summary:
+        chunks.append(render_by_format(tag_rows, "Tags", args.format))
+        chunks.append(render_by_format(cat_rows, "Categories", args.format))
 
     # Singletons (text/markdown/csv/json)
     if args.singletons:
-        single_tag_rows = sorted([(t, 1) for t, files in tag_to_files.items() if len(files) == 1],
-                                 key=lambda kv: kv[0])
-        single_cat_rows = sorted([(c, 1) for c, files in cat_to_files.items() if len(files) == 1],
-                                 key=lambda kv: kv[0])
+        # Derived straight from the counters so the inverse mappings don't
+        # need to be built just for this section.
+        single_tag_rows = sorted((t, 1) for t, cnt in tags_counter.items() if cnt == 1)
+        single_cat_rows = sorted((c, 1) for c, cnt in cats_counter.items() if cnt == 1)
 
         if args.format == "text":
-            print(render_table_text(single_tag_rows, "Singleton tags (used only once)"), end="")
-            print(render_table_text(single_cat_rows, "Singleton categories (used only once)"), end="")
+            chunks.append(render_table_text(single_tag_rows, "Singleton tags (used only once)"))
+            chunks.append(render_table_text(single_cat_rows, "Singleton categories (used only once)"))
         elif args.format == "markdown":
-            print(render_table_markdown(single_tag_rows, "Singleton tags (used only once)"))
-            print(render_table_markdown(single_cat_rows, "Singleton categories (used only once)"))
+            chunks.append(render_table_markdown(single_tag_rows, "Singleton tags (used only once)") + "\n")
+            chunks.append(render_table_markdown(single_cat_rows, "Singleton categories (used only once)") + "\n")
         elif args.format == "csv":
-            sys.stdout.write("# singleton_tags\n")
-            sys.stdout.write(render_table_csv(single_tag_rows, "singleton_tags"))
-            sys.stdout.write("# singleton_categories\n")
-            sys.stdout.write(render_table_csv(single_cat_rows, "singleton_categories"))
+            chunks.append("# singleton_tags\n")
+            chunks.append(render_table_csv(single_tag_rows, "singleton_tags"))
+            chunks.append("# singleton_categories\n")
+            chunks.append(render_table_csv(single_cat_rows, "singleton_categories"))
         else:  # json
             payload = {
                 "singletons": {
@@ -406,42 +709,43 @@ def main() -> None:
                     "categories": [r[0] for r in single_cat_rows],
                 }
             }
-            print(json.dumps(payload, indent=2))
+            chunks.append(dumps_json(payload) + "\n")
 
     # Inverse mappings (respect filters/sort/top)
-    def ordered_keys_from(counter: Counter) -> List[str]:
-        rows = sort_and_filter(counter, args.sort, args.min_count, args.top)
-        return [name for name, _ in rows]
-
     if args.by_tag:
-        ordered = ordered_keys_from(tags_counter)
+        ordered = [name for name, _ in tag_rows]
         header = "Files by Tag"
         if args.format == "markdown":
-            print(render_mapping_markdown(header, ordered, tag_to_files))
+            chunks.append(render_mapping_markdown(header, ordered, tag_to_files) + "\n")
         elif args.format == "csv":
-            sys.stdout.write("# files_by_tag\n")
-            sys.stdout.write(render_mapping_csv(ordered, tag_to_files))
+            chunks.append("# files_by_tag\n")
+            chunks.append(render_mapping_csv(ordered, tag_to_files))
         elif args.format == "json":
-            print(render_mapping_json(ordered, tag_to_files, "files_by_tag"))
+            chunks.append(render_mapping_json(ordered, tag_to_files, "files_by_tag") + "\n")
         else:
-            print(render_mapping_text(header, ordered, tag_to_files), end="")
+            chunks.append(render_mapping_text(header, ordered, tag_to_files))
 
     if args.by_cat:
-        ordered = ordered_keys_from(cats_counter)
+        ordered = [name for name, _ in cat_rows]
         header = "Files by Category"
         if args.format == "markdown":
-            print(render_mapping_markdown(header, ordered, cat_to_files))
+            chunks.append(render_mapping_markdown(header, ordered, cat_to_files) + "\n")
         elif args.format == "csv":
-            sys.stdout.write("# files_by_category\n")
-            sys.stdout.write(render_mapping_csv(ordered, cat_to_files))
+            chunks.append("# files_by_category\n")
+            chunks.append(render_mapping_csv(ordered, cat_to_files))
         elif args.format == "json":
-            print(render_mapping_json(ordered, cat_to_files, "files_by_category"))
+            chunks.append(render_mapping_json(ordered, cat_to_files, "files_by_category") + "\n")
         else:
-            print(render_mapping_text(header, ordered, cat_to_files), end="")
+            chunks.append(render_mapping_text(header, ordered, cat_to_files))
 
     # Friendly footer (TTY only, text mode)
     if args.format == "text" and sys.stdout.isatty():
-        print("\nDone. Need a tag merge/rename tool or fuzzy dup detector next? Say the word.\n")
+        chunks.append("\nDone. Need a tag merge/rename tool or fuzzy dup detector next? Say the word.\n\n")
+
+    # Single bytes write to the underlying buffer: encodes once instead of
+    # per text-layer write, which matters when redirecting large reports.
+    sys.stdout.buffer.write("".join(chunks).encode("utf-8"))
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":